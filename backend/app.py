@@ -7,27 +7,47 @@ and real-time visualization of emergent civilization dynamics.
 
 import asyncio
 import os
-from typing import Optional
-from fastapi import FastAPI, HTTPException, status
+import re
+import uuid
+from contextlib import asynccontextmanager
+from typing import Annotated, Any, Dict, Literal, Optional, Set
+from fastapi import (
+    APIRouter, BackgroundTasks, Depends, FastAPI, HTTPException, Request, Security,
+    WebSocket, WebSocketDisconnect, status
+)
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field, field_validator
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+import msgspec
+import orjson
 import uvicorn
 
-from simulation.engine import SimulationEngine, SimulationConfig, SimulationState
+from simulation.engine import JSON_OPTIONS, SimulationEngine, SimulationConfig, SimulationState
 from simulation.environmental_stimuli import StimulusType
 from adapters import LLMMode
 from auth import verify_api_key, get_auth_status
 
 # Environment-based configuration
-ALLOWED_ORIGINS = os.getenv(
-    "CORS_ORIGINS",
-    "http://localhost:3000,http://localhost:5173,http://localhost:5174"
-).split(",")
+ALLOWED_ORIGINS = tuple(
+    origin.strip()
+    for origin in os.getenv(
+        "CORS_ORIGINS",
+        "http://localhost:3000,http://localhost:5173,http://localhost:5174"
+    ).split(",")
+    if origin.strip()
+)
 ENVIRONMENT = os.getenv("ENVIRONMENT", "development")
 
+# Precompiled checks for user-supplied paths and file names: paths may not be
+# absolute or reference a parent directory, names may not contain separators
+_BAD_PATH = re.compile(r"\.\.|^/|\\")
+_BAD_NAME = re.compile(r"\.\.|[/\\]")
+
 # Request/Response models with validation
 class SimulationConfigRequest(BaseModel):
+    model_config = ConfigDict(extra="forbid", str_max_length=500, validate_assignment=False)
+    
     num_agents: int = Field(default=300, ge=1, le=10000, description="Number of agents")
     seed: Optional[int] = Field(default=42, ge=0, description="Random seed")
     max_ticks: int = Field(default=10000, ge=1, le=1000000, description="Maximum simulation ticks")
@@ -43,102 +63,156 @@ class SimulationConfigRequest(BaseModel):
     snapshot_directory: str = Field(default="snapshots", max_length=200, description="Snapshot directory")
     stimuli_file: Optional[str] = Field(default=None, max_length=500, description="Stimuli file path")
     
-    @field_validator("snapshot_directory")
-    @classmethod
-    def validate_snapshot_directory(cls, v):
-        """Validate snapshot directory doesn't contain path traversal."""
-        if ".." in v or v.startswith("/"):
+    @model_validator(mode="after")
+    def validate_paths(self):
+        """Validate file system paths don't contain path traversal."""
+        if _BAD_PATH.search(self.snapshot_directory):
             raise ValueError("Invalid snapshot directory path")
-        return v
-    
-    @field_validator("stimuli_file")
-    @classmethod
-    def validate_stimuli_file(cls, v):
-        """Validate stimuli file path doesn't contain path traversal."""
-        if v and (".." in v or v.startswith("/")):
+        if self.stimuli_file and _BAD_PATH.search(self.stimuli_file):
             raise ValueError("Invalid stimuli file path")
-        return v
+        return self
 
 
-class SimulationControlRequest(BaseModel):
-    action: str = Field(..., description="Action to perform")
-    
-    @field_validator("action")
-    @classmethod
-    def validate_action(cls, v):
-        """Validate action is one of the allowed values."""
-        allowed_actions = ["start", "pause", "resume", "stop", "step"]
-        if v.lower() not in allowed_actions:
-            raise ValueError(f"Action must be one of: {', '.join(allowed_actions)}")
-        return v.lower()
-
-
-class SnapshotRequest(BaseModel):
-    name: Optional[str] = Field(default=None, max_length=100, description="Snapshot name")
+# Lightweight request bodies are decoded with msgspec rather than pydantic
+class SimulationControlRequest(msgspec.Struct):
+    action: Literal["start", "pause", "resume", "stop", "step"]
+
+
+class SnapshotRequest(msgspec.Struct):
+    name: Optional[Annotated[str, msgspec.Meta(max_length=100)]] = None
     
-    @field_validator("name")
-    @classmethod
-    def validate_name(cls, v):
+    def __post_init__(self):
         """Validate snapshot name doesn't contain dangerous characters."""
-        if v and (".." in v or "/" in v or "\\" in v):
+        if self.name and _BAD_NAME.search(self.name):
             raise ValueError("Invalid snapshot name")
-        return v
+
+
+def msgspec_body(struct_type: type):
+    """Build a dependency that decodes the JSON request body into a msgspec Struct."""
+    async def decode_body(request: Request):
+        try:
+            return msgspec.json.decode(await request.body() or b"{}", type=struct_type)
+        except msgspec.DecodeError as e:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=str(e)
+            )
+    return decode_body
+
+
+def msgspec_request_body(struct_type: type) -> Dict[str, Any]:
+    """Build the openapi_extra documenting a body decoded by msgspec_body."""
+    _, components = msgspec.json.schema_components(
+        [struct_type], ref_template="#/components/schemas/{name}"
+    )
+    schema = components[struct_type.__name__]
+    return {
+        "requestBody": {
+            "content": {"application/json": {"schema": schema}},
+            "required": bool(schema.get("required")),
+        }
+    }
 
 
 # Global simulation engine instance
 simulation_engine: Optional[SimulationEngine] = None
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize the simulation engine on startup and clean it up on shutdown."""
+    global simulation_engine
+    broadcast_task = None
+    try:
+        try:
+            config = SimulationConfig()
+            simulation_engine = SimulationEngine(config)
+            print("Simulation engine initialized on startup")
+        except Exception as e:
+            print(f"Failed to initialize simulation engine: {e}")
+        broadcast_task = asyncio.create_task(_broadcast_realtime())
+        yield
+    finally:
+        if broadcast_task:
+            broadcast_task.cancel()
+        if simulation_engine:
+            simulation_engine.cleanup()
+            print("Simulation engine cleaned up")
+
+
+def get_engine() -> SimulationEngine:
+    """Dependency providing the initialized simulation engine."""
+    if simulation_engine is None:
+        raise HTTPException(status_code=400, detail="Simulation not initialized")
+    return simulation_engine
+
+
+def tick_etag(
+    request: Request,
+    response: Response,
+    engine: SimulationEngine = Depends(get_engine)
+):
+    """
+    Dependency adding a per-tick weak ETag to the response.
+    
+    Data behind these endpoints only changes as the world ticks, so the ETag
+    follows the world's revision (bumped when a tick completes) and a client
+    presenting the current ETag is answered with 304 Not Modified.
+    """
+    if not engine.world:
+        return
+    etag = f'W/"{engine.world_generation}-{engine.world.revision}"'
+    headers = {"ETag": etag, "Cache-Control": "private, max-age=0, must-revalidate"}
+    if request.headers.get("if-none-match") == etag:
+        raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+
+
+# Routes that modify simulation state require an API key when auth is enabled;
+# the check is attached once to this router instead of to each route
+protected_router = APIRouter(dependencies=[Security(verify_api_key)])
+
+
 # Create FastAPI app
 app = FastAPI(
     title="The Cognisphere API",
     description="API for emergent intelligence civilization simulation",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware with environment-based configuration
-# In production, restrict to allowed origins; in development, allow all
-cors_origins = ALLOWED_ORIGINS if ENVIRONMENT == "production" else ["*"]
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=cors_origins,
-    allow_credentials=True,
-    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-    allow_headers=["*"],
-    expose_headers=["*"],
-)
-
-
-@app.on_event("startup")
-async def startup_event():
-    """Initialize the simulation engine on startup."""
-    global simulation_engine
-    try:
-        config = SimulationConfig()
-        simulation_engine = SimulationEngine(config)
-        print("Simulation engine initialized on startup")
-    except Exception as e:
-        print(f"Failed to initialize simulation engine: {e}")
+# In production, restrict to allowed origins; in development, allow all.
+# A production deployment with no configured origins is same-origin only
+# and skips the middleware entirely.
+cors_origins = ALLOWED_ORIGINS if ENVIRONMENT == "production" else ("*",)
+if cors_origins:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=cors_origins,
+        allow_credentials=True,
+        allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+        allow_headers=["Authorization", "Content-Type", "If-None-Match"],
+        expose_headers=["ETag"],
+        max_age=86400,
+    )
 
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Clean up resources on shutdown."""
-    global simulation_engine
-    if simulation_engine:
-        simulation_engine.cleanup()
-        print("Simulation engine cleaned up")
+# Compress large JSON payloads (agents, network, history); added after CORS
+# so it wraps the CORS middleware and sees the final response headers
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
 
 # Health check endpoints
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
-    return {"status": "healthy", "timestamp": "2024-01-01T00:00:00Z"}
+    return ORJSONResponse(content={"status": "healthy", "timestamp": "2024-01-01T00:00:00Z"})
 
 @app.get("/healthz")
 async def healthz():
     """Kubernetes-style health check endpoint."""
-    return {"ok": True}
+    return ORJSONResponse(content={"ok": True})
 
 @app.get("/")
 async def root():
@@ -168,11 +242,8 @@ async def auth_status():
 
 
 # Simulation control endpoints
-@app.post("/simulation/initialize")
-async def initialize_simulation(
-    config: SimulationConfigRequest,
-    authenticated: bool = Security(verify_api_key)
-):
+@protected_router.post("/simulation/initialize")
+async def initialize_simulation(config: SimulationConfigRequest):
     """
     Initialize a new simulation with the given configuration.
     
@@ -236,42 +307,40 @@ async def initialize_simulation(
         )
 
 
-@app.post("/simulation/control")
+@protected_router.post(
+    "/simulation/control",
+    openapi_extra=msgspec_request_body(SimulationControlRequest)
+)
 async def control_simulation(
-    request: SimulationControlRequest,
-    authenticated: bool = Security(verify_api_key)
+    request: SimulationControlRequest = Depends(msgspec_body(SimulationControlRequest)),
+    engine: SimulationEngine = Depends(get_engine)
 ):
     """Control simulation execution (start, pause, resume, stop, step)."""
-    global simulation_engine
-    
-    if not simulation_engine:
-        raise HTTPException(status_code=400, detail="Simulation not initialized")
-    
     try:
-        action = request.action.lower()
+        action = request.action
         
         if action == "start":
-            if simulation_engine.state == SimulationState.READY:
+            if engine.state == SimulationState.READY:
                 # Start simulation in background
-                asyncio.create_task(simulation_engine.run_simulation())
+                asyncio.create_task(engine.run_simulation())
                 return {"status": "started"}
             else:
                 raise HTTPException(status_code=400, detail="Simulation not ready")
         
         elif action == "pause":
-            await simulation_engine.pause_simulation()
+            await engine.pause_simulation()
             return {"status": "paused"}
         
         elif action == "resume":
-            await simulation_engine.resume_simulation()
+            await engine.resume_simulation()
             return {"status": "resumed"}
         
         elif action == "stop":
-            await simulation_engine.stop_simulation()
+            await engine.stop_simulation()
             return {"status": "stopped"}
         
         elif action == "step":
-            await simulation_engine.step_simulation()
+            await engine.step_simulation()
             return {"status": "stepped"}
         
         else:
@@ -284,8 +353,6 @@ async def control_simulation(
 @app.get("/simulation/status")
 async def get_simulation_status():
     """Get current simulation status."""
-    global simulation_engine
-    
     if not simulation_engine:
         return {"status": "not_initialized"}
     
@@ -297,31 +364,21 @@ async def get_simulation_status():
 
 
 # Data access endpoints
-@app.get("/agents")
-async def get_agents(agent_id: Optional[str] = None):
+@app.get("/agents", dependencies=[Depends(tick_etag)])
+async def get_agents(agent_id: Optional[str] = None, engine: SimulationEngine = Depends(get_engine)):
     """Get agent data."""
-    global simulation_engine
-    
-    if not simulation_engine:
-        raise HTTPException(status_code=400, detail="Simulation not initialized")
-    
     try:
-        data = await simulation_engine.get_agent_data(agent_id)
+        data = await engine.get_agent_data(agent_id)
         return data
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.get("/agents/{agent_id}")
-async def get_agent(agent_id: str):
+@app.get("/agents/{agent_id}", dependencies=[Depends(tick_etag)])
+async def get_agent(agent_id: str, engine: SimulationEngine = Depends(get_engine)):
     """Get specific agent data."""
-    global simulation_engine
-    
-    if not simulation_engine:
-        raise HTTPException(status_code=400, detail="Simulation not initialized")
-    
     try:
-        data = await simulation_engine.get_agent_data(agent_id)
+        data = await engine.get_agent_data(agent_id)
         if not data:
             raise HTTPException(status_code=404, detail="Agent not found")
         return data
@@ -329,63 +386,45 @@ async def get_agent(agent_id: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.get("/culture")
-async def get_cultural_data():
+@app.get("/culture", dependencies=[Depends(tick_etag)])
+async def get_cultural_data(engine: SimulationEngine = Depends(get_engine)):
     """Get cultural data (myths, norms, slang)."""
-    global simulation_engine
-    
-    if not simulation_engine:
-        raise HTTPException(status_code=400, detail="Simulation not initialized")
-    
     try:
-        data = await simulation_engine.get_cultural_data()
+        data = await engine.get_cultural_data()
         return data
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.get("/economy")
-async def get_economic_data():
+@app.get("/economy", dependencies=[Depends(tick_etag)])
+async def get_economic_data(engine: SimulationEngine = Depends(get_engine)):
     """Get economic data."""
-    global simulation_engine
-    
-    if not simulation_engine:
-        raise HTTPException(status_code=400, detail="Simulation not initialized")
-    
     try:
-        data = await simulation_engine.get_economic_data()
+        data = await engine.get_economic_data()
         return data
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/network")
-async def get_network_data():
+async def get_network_data(engine: SimulationEngine = Depends(get_engine)):
     """Get agent network data for visualization."""
-    global simulation_engine
-    
-    if not simulation_engine:
-        raise HTTPException(status_code=400, detail="Simulation not initialized")
-    
     try:
-        data = await simulation_engine.get_network_data()
+        data = await engine.get_network_data()
         return data
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/world")
-async def get_world_summary():
+async def get_world_summary(engine: SimulationEngine = Depends(get_engine)):
     """Get comprehensive world summary."""
-    global simulation_engine
-    
-    if not simulation_engine:
-        raise HTTPException(status_code=400, detail="Simulation not initialized")
-    
     try:
-        if simulation_engine.world:
-            summary = simulation_engine.world.get_world_summary()
-            return summary
+        if engine.world:
+            return Response(
+                content=engine.get_world_summary_json(),
+                media_type="application/json"
+            )
         else:
             return {"error": "World not initialized"}
     except Exception as e:
@@ -393,52 +432,83 @@ async def get_world_summary():
 
 
 # Snapshot endpoints
-@app.post("/snapshots")
+# Snapshot jobs run in the background; clients poll /snapshots/{job_id}/status
+MAX_SNAPSHOT_JOBS = 100
+snapshot_jobs: Dict[str, Dict[str, Any]] = {}
+
+
+async def _run_snapshot_job(engine: SimulationEngine, job_id: str, name: Optional[str]):
+    """Take a snapshot and record the outcome on its job."""
+    job = snapshot_jobs.get(job_id)
+    if job is None:
+        return
+    try:
+        job["file"] = await engine.take_snapshot(name)
+        job["status"] = "completed"
+    except Exception as e:
+        job["status"] = "failed"
+        job["error"] = str(e) if ENVIRONMENT != "production" else "Snapshot failed"
+
+
+def _evict_finished_snapshot_jobs():
+    """Drop the oldest finished jobs beyond MAX_SNAPSHOT_JOBS; pending jobs are kept."""
+    excess = len(snapshot_jobs) - MAX_SNAPSHOT_JOBS
+    if excess <= 0:
+        return
+    finished = [job_id for job_id, job in snapshot_jobs.items() if job["status"] != "pending"]
+    for job_id in finished[:excess]:
+        del snapshot_jobs[job_id]
+
+
+@protected_router.post(
+    "/snapshots",
+    status_code=status.HTTP_202_ACCEPTED,
+    openapi_extra=msgspec_request_body(SnapshotRequest)
+)
 async def take_snapshot(
-    request: SnapshotRequest,
-    authenticated: bool = Security(verify_api_key)
+    background_tasks: BackgroundTasks,
+    request: SnapshotRequest = Depends(msgspec_body(SnapshotRequest)),
+    engine: SimulationEngine = Depends(get_engine)
 ):
-    """Take a snapshot of the current simulation state."""
-    global simulation_engine
+    """Start taking a snapshot of the current simulation state."""
+    if not engine.world:
+        raise HTTPException(status_code=400, detail="World not initialized")
     
-    if not simulation_engine:
-        raise HTTPException(status_code=400, detail="Simulation not initialized")
+    job_id = str(uuid.uuid4())
+    snapshot_jobs[job_id] = {"job_id": job_id, "status": "pending", "file": None, "error": None}
+    _evict_finished_snapshot_jobs()
     
-    try:
-        snapshot_file = await simulation_engine.take_snapshot(request.name)
-        return {"status": "snapshot_created", "file": snapshot_file}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    background_tasks.add_task(_run_snapshot_job, engine, job_id, request.name)
+    return {"status": "snapshot_pending", "job_id": job_id}
+
+
+@app.get("/snapshots/{job_id}/status")
+async def get_snapshot_status(job_id: str):
+    """Get the status of a snapshot job."""
+    job = snapshot_jobs.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Snapshot job not found")
+    return job
 
 
 @app.get("/snapshots")
-async def list_snapshots():
+async def list_snapshots(engine: SimulationEngine = Depends(get_engine)):
     """List available snapshots."""
-    global simulation_engine
-    
-    if not simulation_engine:
-        raise HTTPException(status_code=400, detail="Simulation not initialized")
-    
     try:
-        snapshots = simulation_engine.snapshots
+        snapshots = engine.snapshots
         return {"snapshots": [{"name": s["name"], "tick": s["tick"], "timestamp": s["timestamp"]} for s in snapshots]}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/snapshots/load")
+@protected_router.post("/snapshots/load")
 async def load_snapshot(
     snapshot_file: str,
-    authenticated: bool = Security(verify_api_key)
+    engine: SimulationEngine = Depends(get_engine)
 ):
     """Load a snapshot and restore simulation state."""
-    global simulation_engine
-    
-    if not simulation_engine:
-        raise HTTPException(status_code=400, detail="Simulation not initialized")
-    
     try:
-        success = await simulation_engine.load_snapshot(snapshot_file)
+        success = await engine.load_snapshot(snapshot_file)
         if success:
             return {"status": "snapshot_loaded", "file": snapshot_file}
         else:
@@ -451,8 +521,6 @@ async def load_snapshot(
 @app.get("/realtime/status")
 async def get_realtime_status():
     """Get real-time simulation status for dashboard."""
-    global simulation_engine
-    
     if not simulation_engine:
         return {"status": "not_initialized", "data": None}
     
@@ -461,15 +529,7 @@ async def get_realtime_status():
         
         # Add real-time metrics
         if simulation_engine.world:
-            status["realtime"] = {
-                "current_tick": simulation_engine.world.current_tick,
-                "agent_count": len(simulation_engine.world.agents),
-                "faction_count": len(simulation_engine.world.factions),
-                "active_events": len(simulation_engine.world.event_system.active_events),
-                "myth_count": len(simulation_engine.world.culture.myths),
-                "norm_count": len(simulation_engine.world.culture.active_norms),
-                "trade_count": len(simulation_engine.world.economy.trade_history)
-            }
+            status["realtime"] = simulation_engine.world.realtime_stats()
         
         return status
     except Exception as e:
@@ -479,8 +539,6 @@ async def get_realtime_status():
 @app.get("/realtime/network")
 async def get_realtime_network():
     """Get real-time network data for visualization."""
-    global simulation_engine
-    
     if not simulation_engine:
         return {"nodes": [], "edges": []}
     
@@ -494,8 +552,6 @@ async def get_realtime_network():
 @app.get("/realtime/culture")
 async def get_realtime_culture():
     """Get real-time cultural data."""
-    global simulation_engine
-    
     if not simulation_engine:
         return {"myths": [], "norms": [], "slang": []}
     
@@ -509,8 +565,6 @@ async def get_realtime_culture():
 @app.get("/realtime/economy")
 async def get_realtime_economy():
     """Get real-time economic data."""
-    global simulation_engine
-    
     if not simulation_engine:
         return {"market": {}, "gini_coefficient": 0.0}
     
@@ -521,18 +575,123 @@ async def get_realtime_economy():
         return {"market": {}, "gini_coefficient": 0.0, "error": str(e)}
 
 
+# Real-time WebSocket channel: one payload per tick, shared by all subscribers
+REALTIME_BROADCAST_INTERVAL = 0.1  # seconds between checks for a new tick
+REALTIME_SEND_TIMEOUT = 1.0  # seconds before a stalled subscriber is dropped
+REALTIME_CLOSE_TIMEOUT = 1.0  # seconds allowed for closing a dropped subscriber
+realtime_clients: Set[WebSocket] = set()
+_realtime_close_tasks: Set[asyncio.Task] = set()
+last_realtime_key: Optional[tuple] = None
+last_realtime_message: Optional[str] = None
+
+
+def _realtime_key(engine: Optional[SimulationEngine]) -> Optional[tuple]:
+    """Identify the world data a real-time payload was built from."""
+    if not engine or not engine.world:
+        return None
+    world = engine.world
+    return (engine.world_generation, world.revision, world.current_tick, engine.state)
+
+
+@app.websocket("/ws/realtime")
+async def realtime_websocket(websocket: WebSocket):
+    """Push real-time status, network, culture and economy data once per tick."""
+    await websocket.accept()
+    realtime_clients.add(websocket)
+    try:
+        # Late joiners get the current payload without waiting for the next tick,
+        # unless it was built for a world that has since been replaced
+        if last_realtime_message is not None and last_realtime_key == _realtime_key(simulation_engine):
+            await websocket.send_text(last_realtime_message)
+        while True:
+            # Incoming text or binary messages are ignored; receiving detects disconnects
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
+    except WebSocketDisconnect:
+        pass
+    finally:
+        realtime_clients.discard(websocket)
+
+
+async def _broadcast_realtime():
+    """Serialize the real-time payload once per tick and fan it out to subscribers."""
+    global last_realtime_key, last_realtime_message
+    while True:
+        await asyncio.sleep(REALTIME_BROADCAST_INTERVAL)
+        engine = simulation_engine
+        if not realtime_clients or not engine or not engine.world:
+            continue
+        
+        key = _realtime_key(engine)
+        if key == last_realtime_key:
+            continue
+        
+        try:
+            message = orjson.dumps({
+                "tick": engine.world.current_tick,
+                "state": engine.state.value,
+                "realtime": engine.world.realtime_stats(),
+                "network": await engine.get_network_data(),
+                "culture": await engine.get_cultural_data(),
+                "economy": await engine.get_economic_data()
+            }, option=JSON_OPTIONS).decode()
+        except Exception as e:
+            print(f"Failed to build real-time payload: {e}")
+            last_realtime_key, last_realtime_message = key, None
+            continue
+        last_realtime_key, last_realtime_message = key, message
+        
+        # A subscriber that can't take the message in time is dropped rather
+        # than holding up the broadcast for everyone else
+        clients = list(realtime_clients)
+        results = await asyncio.gather(
+            *(asyncio.wait_for(client.send_text(message), REALTIME_SEND_TIMEOUT) for client in clients),
+            return_exceptions=True
+        )
+        for client, result in zip(clients, results):
+            if isinstance(result, Exception):
+                _drop_realtime_client(client)
+
+
+def _drop_realtime_client(client: WebSocket):
+    """Unsubscribe a client and close its socket in the background so it can reconnect."""
+    realtime_clients.discard(client)
+    task = asyncio.create_task(_close_realtime_client(client))
+    _realtime_close_tasks.add(task)
+    task.add_done_callback(_realtime_close_tasks.discard)
+
+
+async def _close_realtime_client(client: WebSocket):
+    """Close a dropped client's socket, giving up if the close itself stalls."""
+    try:
+        await asyncio.wait_for(
+            client.close(code=status.WS_1011_INTERNAL_ERROR), REALTIME_CLOSE_TIMEOUT
+        )
+    except Exception:
+        pass
+
+
 # Statistics and analytics endpoints
+STREAM_BATCH_SIZE = 256
+
+
+async def _stream_json_list(key: str, items: list):
+    """Stream {key: items} as JSON, encoding the list in batches."""
+    yield b'{"' + key.encode() + b'":['
+    for start in range(0, len(items), STREAM_BATCH_SIZE):
+        batch = items[start:start + STREAM_BATCH_SIZE]
+        chunk = b",".join(orjson.dumps(item, option=JSON_OPTIONS) for item in batch)
+        yield chunk if start == 0 else b"," + chunk
+    yield b"]}"
+
+
 @app.get("/stats/performance")
-async def get_performance_stats():
+async def get_performance_stats(engine: SimulationEngine = Depends(get_engine)):
     """Get simulation performance statistics."""
-    global simulation_engine
-    
-    if not simulation_engine:
-        raise HTTPException(status_code=400, detail="Simulation not initialized")
-    
     try:
-        if simulation_engine.scheduler:
-            stats = simulation_engine.scheduler.get_performance_stats()
+        if engine.scheduler:
+            stats = engine.scheduler.get_performance_stats()
             return stats
         else:
             return {"error": "Scheduler not initialized"}
@@ -541,16 +700,16 @@ async def get_performance_stats():
 
 
 @app.get("/stats/history")
-async def get_simulation_history():
+async def get_simulation_history(engine: SimulationEngine = Depends(get_engine)):
     """Get simulation tick history."""
-    global simulation_engine
-    
-    if not simulation_engine:
-        raise HTTPException(status_code=400, detail="Simulation not initialized")
-    
     try:
-        if simulation_engine.world and simulation_engine.world.tick_history:
-            return {"history": simulation_engine.world.tick_history}
+        if engine.world and engine.world.tick_history:
+            # Copy so ticks recorded while streaming don't alter the response
+            history = list(engine.world.tick_history)
+            return StreamingResponse(
+                _stream_json_list("history", history),
+                media_type="application/json"
+            )
         else:
             return {"history": []}
     except Exception as e:
@@ -559,35 +718,26 @@ async def get_simulation_history():
 
 # Utility endpoints
 @app.get("/config")
-async def get_config():
+async def get_config(engine: SimulationEngine = Depends(get_engine)):
     """Get current simulation configuration."""
-    global simulation_engine
-    
-    if not simulation_engine:
-        raise HTTPException(status_code=400, detail="Simulation not initialized")
-    
     try:
-        return {"config": simulation_engine.config.to_dict()}
+        return Response(
+            content=b'{"config":' + engine.get_config_json() + b'}',
+            media_type="application/json"
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/reset")
-async def reset_simulation(
-    authenticated: bool = Security(verify_api_key)
-):
+@protected_router.post("/reset")
+async def reset_simulation(engine: SimulationEngine = Depends(get_engine)):
     """Reset the simulation to initial state."""
-    global simulation_engine
-    
-    if not simulation_engine:
-        raise HTTPException(status_code=400, detail="Simulation not initialized")
-    
     try:
         # Stop current simulation
-        await simulation_engine.stop_simulation()
+        await engine.stop_simulation()
         
         # Reinitialize
-        success = await simulation_engine.initialize()
+        success = await engine.initialize()
         
         if success:
             return {"status": "reset_complete"}
@@ -598,6 +748,30 @@ async def reset_simulation(
 
 
 # Environmental Stimuli endpoints
+STIMULUS_CONTENT_PREVIEW_LENGTH = 200
+
+
+def _stimulus_to_dict(stimulus) -> dict:
+    """Convert a stimulus to its JSON-serializable API representation."""
+    content = stimulus.content
+    if len(content) > STIMULUS_CONTENT_PREVIEW_LENGTH:
+        content = content[:STIMULUS_CONTENT_PREVIEW_LENGTH] + "..."
+    return {
+        "id": stimulus.id,
+        "type": stimulus.type_value,
+        "title": stimulus.title,
+        "content": content,
+        "source": stimulus.source,
+        "timestamp": stimulus.timestamp_iso,
+        "intensity": stimulus.intensity_value,
+        "sentiment": stimulus.sentiment,
+        "keywords": stimulus.keywords,
+        "cultural_impact": stimulus.cultural_impact,
+        "economic_impact": stimulus.economic_impact,
+        "social_impact": stimulus.social_impact
+    }
+
+
 @app.get("/stimuli/status")
 async def get_stimuli_status():
     """Get environmental stimuli system status."""
@@ -611,7 +785,7 @@ async def get_stimuli_status():
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.get("/stimuli/active")
+@app.get("/stimuli/active", response_model=None)
 async def get_active_stimuli():
     """Get currently active environmental stimuli."""
     try:
@@ -621,32 +795,17 @@ async def get_active_stimuli():
         stimuli = simulation_engine.stimuli_manager.get_active_stimuli()
         
         # Convert to JSON-serializable format
-        stimuli_data = []
-        for stimulus in stimuli:
-            stimuli_data.append({
-                "id": stimulus.id,
-                "type": stimulus.stimulus_type.value,
-                "title": stimulus.title,
-                "content": stimulus.content[:200] + "..." if len(stimulus.content) > 200 else stimulus.content,
-                "source": stimulus.source,
-                "timestamp": stimulus.timestamp.isoformat(),
-                "intensity": stimulus.intensity.value,
-                "sentiment": stimulus.sentiment,
-                "keywords": stimulus.keywords,
-                "cultural_impact": stimulus.cultural_impact,
-                "economic_impact": stimulus.economic_impact,
-                "social_impact": stimulus.social_impact
-            })
+        stimuli_data = [_stimulus_to_dict(stimulus) for stimulus in stimuli]
         
-        return {
+        return ORJSONResponse(content={
             "count": len(stimuli_data),
             "stimuli": stimuli_data
-        }
+        })
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.get("/stimuli/by-type/{stimulus_type}")
+@app.get("/stimuli/by-type/{stimulus_type}", response_model=None)
 async def get_stimuli_by_type(stimulus_type: str):
     """Get stimuli filtered by type."""
     try:
@@ -662,36 +821,19 @@ async def get_stimuli_by_type(stimulus_type: str):
         stimuli = simulation_engine.stimuli_manager.get_stimuli_by_type(stimulus_type_enum)
         
         # Convert to JSON-serializable format
-        stimuli_data = []
-        for stimulus in stimuli:
-            stimuli_data.append({
-                "id": stimulus.id,
-                "type": stimulus.stimulus_type.value,
-                "title": stimulus.title,
-                "content": stimulus.content[:200] + "..." if len(stimulus.content) > 200 else stimulus.content,
-                "source": stimulus.source,
-                "timestamp": stimulus.timestamp.isoformat(),
-                "intensity": stimulus.intensity.value,
-                "sentiment": stimulus.sentiment,
-                "keywords": stimulus.keywords,
-                "cultural_impact": stimulus.cultural_impact,
-                "economic_impact": stimulus.economic_impact,
-                "social_impact": stimulus.social_impact
-            })
+        stimuli_data = [_stimulus_to_dict(stimulus) for stimulus in stimuli]
         
-        return {
+        return ORJSONResponse(content={
             "type": stimulus_type,
             "count": len(stimuli_data),
             "stimuli": stimuli_data
-        }
+        })
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/stimuli/fetch")
-async def fetch_stimuli(
-    authenticated: bool = Security(verify_api_key)
-):
+@protected_router.post("/stimuli/fetch")
+async def fetch_stimuli():
     """Manually trigger fetching of environmental stimuli."""
     try:
         if not simulation_engine or not simulation_engine.stimuli_manager:
@@ -732,22 +874,40 @@ async def get_cultural_divergence():
 
 
 # Error handlers
+# Built once: production never varies the body, so there is nothing to format per error
+_PROD_ERROR_RESPONSE = ORJSONResponse(
+    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+    content={"detail": "Internal server error"}
+)
+
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
-    """Global exception handler with security-aware error messages."""
+    """
+    Global exception handler with security-aware error messages.
+    
+    Starlette re-raises the exception after this handler runs, so the server
+    (uvicorn's error logger) records the traceback; it isn't logged here too.
+    """
     # Don't leak internal error details in production
-    error_detail = str(exc) if ENVIRONMENT != "production" else "Internal server error"
-    return JSONResponse(
+    if ENVIRONMENT == "production":
+        return _PROD_ERROR_RESPONSE
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content={"detail": error_detail}
+        content={"detail": str(exc)}
     )
 
 
+app.include_router(protected_router)
+
+
 if __name__ == "__main__":
     uvicorn.run(
         "app:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        reload=ENVIRONMENT != "production",
+        loop="uvloop",
+        http="httptools",
         log_level="info"
     )
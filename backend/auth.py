@@ -4,6 +4,7 @@ Authentication and authorization utilities for The Cognisphere API.
 Provides API key-based authentication for protecting endpoints.
 """
 
+import hmac
 import os
 from typing import Optional
 from fastapi import HTTPException, status, Security
@@ -12,9 +13,21 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 # Security scheme
 security = HTTPBearer(auto_error=False)
 
-# Get API key from environment
-API_KEY = os.getenv("API_KEY", None)
-REQUIRE_AUTH = os.getenv("REQUIRE_AUTH", "false").lower() == "true"
+# Authentication configuration, read from the environment by _reload_config()
+API_KEY: Optional[str] = None
+_API_KEY_BYTES: Optional[bytes] = None
+REQUIRE_AUTH: bool = False
+
+
+def _reload_config() -> None:
+    """Re-read authentication settings from the environment."""
+    global API_KEY, _API_KEY_BYTES, REQUIRE_AUTH
+    API_KEY = os.getenv("API_KEY", None)
+    _API_KEY_BYTES = API_KEY.encode() if API_KEY else None
+    REQUIRE_AUTH = os.getenv("REQUIRE_AUTH", "false").lower() == "true"
+
+
+_reload_config()
 
 
 async def verify_api_key(
@@ -37,7 +50,7 @@ async def verify_api_key(
         return True
     
     # If no API key is configured, allow access (development mode)
-    if not API_KEY:
+    if _API_KEY_BYTES is None:
         return True
     
     # If no credentials provided, deny access
@@ -48,8 +61,8 @@ async def verify_api_key(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    # Verify API key
-    if credentials.credentials != API_KEY:
+    # Verify API key in constant time so response timing doesn't leak the key
+    if not hmac.compare_digest(credentials.credentials.encode(), _API_KEY_BYTES):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid API key",
@@ -0,0 +1,18 @@
+"""
+Gunicorn configuration for serving The Cognisphere API in production.
+
+The app is preloaded in the master process and then forked, so workers
+share the imported modules copy-on-write. Each worker still owns its own
+simulation engine (created by the app lifespan after fork), so running
+more than one worker is only appropriate for read-mostly deployments
+where the load balancer pins writes (/simulation/*, /snapshots) to a
+single worker.
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+worker_class = "uvicorn.workers.UvicornWorker"
+workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+preload_app = True
+loglevel = os.getenv("LOG_LEVEL", "info").lower()
@@ -5,6 +5,8 @@ The SimulationEngine is the central coordinator that manages the world state,
 scheduler, and all simulation systems to create emergent civilization dynamics.
 """
 
+import asyncio
+import itertools
 import time
 import json
 import os
@@ -13,6 +15,14 @@ from typing import Dict, List, Optional, Any, Callable
 from dataclasses import dataclass
 from enum import Enum
 
+import orjson
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
 from .world import World, WorldState
 from .scheduler import SimulationScheduler, SchedulerConfig
 from .environmental_stimuli import EnvironmentalStimuliManager, create_default_stimuli_manager
@@ -25,6 +35,12 @@ except ImportError:
     sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
     from adapters import LLMAdapter, LLMAdapterFactory, LLMConfig, LLMMode
 
+# orjson options matching FastAPI's ORJSONResponse
+JSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+# Process-wide counter so every world built by any engine gets a distinct generation
+_world_generations = itertools.count(1)
+
 
 class SimulationState(Enum):
     """Overall simulation states."""
@@ -100,11 +116,18 @@ class SimulationEngine:
         self.llm_adapter: Optional[LLMAdapter] = None
         self.stimuli_manager: Optional[EnvironmentalStimuliManager] = None
         
+        # Distinguishes successive worlds whose tick counters restart at 0
+        self.world_generation = 0
+        
         # State tracking
         self.start_time: Optional[float] = None
         self.end_time: Optional[float] = None
         self.snapshots: List[Dict[str, Any]] = []
         
+        # Serialized views reused between ticks, keyed on what invalidates them
+        self._config_cache: Optional[tuple] = None
+        self._world_summary_cache: Optional[tuple] = None
+        
         # Callbacks
         self.tick_callbacks: List[Callable[[int], None]] = []
         self.completion_callbacks: List[Callable[[], None]] = []
@@ -114,6 +137,7 @@ class SimulationEngine:
         """Initialize the simulation engine."""
         try:
             self.state = SimulationState.INITIALIZING
+            self._world_summary_cache = None
             print("Initializing simulation engine...")
             
             # Initialize LLM adapter
@@ -130,6 +154,7 @@ class SimulationEngine:
             
             # Initialize world
             self.world = World(seed=self.config.seed)
+            self.world_generation = next(_world_generations)
             self.world.initialize_world(
                 num_agents=self.config.num_agents,
                 seed=self.config.seed
@@ -252,10 +277,10 @@ class SimulationEngine:
             "cultural_timeline": self.world.get_cultural_timeline()
         }
         
-        # Save to file
-        snapshot_file = os.path.join(self.config.snapshot_directory, f"{name}.json")
-        with open(snapshot_file, 'w') as f:
-            json.dump(snapshot, f, indent=2)
+        # Serialize, compress and write off the event loop
+        extension = ".json.zst" if ZSTD_AVAILABLE else ".json"
+        snapshot_file = os.path.join(self.config.snapshot_directory, f"{name}{extension}")
+        await asyncio.to_thread(self._write_snapshot_file, snapshot_file, snapshot)
         
         self.snapshots.append(snapshot)
         print(f"Snapshot saved: {snapshot_file}")
@@ -265,8 +290,7 @@ class SimulationEngine:
     async def load_snapshot(self, snapshot_file: str) -> bool:
         """Load a snapshot and restore simulation state."""
         try:
-            with open(snapshot_file, 'r') as f:
-                snapshot = json.load(f)
+            snapshot = await asyncio.to_thread(self._read_snapshot_file, snapshot_file)
             
             # Restore configuration
             config_dict = snapshot.get("config", {})
@@ -288,6 +312,26 @@ class SimulationEngine:
             print(f"Failed to load snapshot: {e}")
             return False
     
+    @staticmethod
+    def _write_snapshot_file(snapshot_file: str, snapshot: Dict[str, Any]):
+        """Write a snapshot to disk, zstd-compressed when the file name ends in .zst."""
+        data = orjson.dumps(snapshot, option=JSON_OPTIONS | orjson.OPT_INDENT_2)
+        with open(snapshot_file, 'wb') as f:
+            if snapshot_file.endswith(".zst"):
+                with zstandard.ZstdCompressor(level=3).stream_writer(f, closefd=False) as writer:
+                    writer.write(data)
+            else:
+                f.write(data)
+    
+    @staticmethod
+    def _read_snapshot_file(snapshot_file: str) -> Dict[str, Any]:
+        """Read a snapshot written by _write_snapshot_file."""
+        with open(snapshot_file, 'rb') as f:
+            if snapshot_file.endswith(".zst"):
+                with zstandard.ZstdDecompressor().stream_reader(f) as reader:
+                    return orjson.loads(reader.read())
+            return orjson.loads(f.read())
+    
     async def get_simulation_status(self) -> Dict[str, Any]:
         """Get current simulation status."""
         status = {
@@ -299,13 +343,41 @@ class SimulationEngine:
         }
         
         if self.world:
-            status["world_summary"] = self.world.get_world_summary()
+            status["world_summary"] = self.get_world_summary()
         
         if self.scheduler:
             status["scheduler_stats"] = self.scheduler.get_performance_stats()
         
         return status
     
+    def get_config_json(self) -> bytes:
+        """Get the configuration as JSON bytes, rebuilt only when the config changes."""
+        if self._config_cache is None or self._config_cache[0] is not self.config:
+            self._config_cache = (self.config, orjson.dumps(self.config.to_dict()))
+        return self._config_cache[1]
+    
+    def get_world_summary(self) -> Dict[str, Any]:
+        """Get the world summary, rebuilt at most once per tick."""
+        self._refresh_world_summary_cache()
+        return self._world_summary_cache[1]
+    
+    def get_world_summary_json(self) -> bytes:
+        """Get the world summary as JSON bytes, rebuilt at most once per tick."""
+        self._refresh_world_summary_cache()
+        return self._world_summary_cache[2]
+    
+    def _refresh_world_summary_cache(self):
+        """Rebuild the cached world summary if the world or its data changed."""
+        key = (
+            self.world_generation, self.world.revision,
+            self.world.current_tick, self.world.state
+        )
+        if self._world_summary_cache is None or self._world_summary_cache[0] != key:
+            summary = self.world.get_world_summary()
+            self._world_summary_cache = (
+                key, summary, orjson.dumps(summary, option=JSON_OPTIONS)
+            )
+    
     async def get_agent_data(self, agent_id: Optional[str] = None) -> Dict[str, Any]:
         """Get agent data for visualization."""
         if not self.world:
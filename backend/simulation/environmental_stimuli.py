@@ -55,6 +55,17 @@ class EnvironmentalStimulus:
     economic_impact: float = 0.0  # How much this affects economy
     social_impact: float = 0.0  # How much this affects social dynamics
     processed: bool = False
+    
+    # Serialized forms of the fields that never change after ingest
+    type_value: str = field(init=False, repr=False, compare=False)
+    intensity_value: float = field(init=False, repr=False, compare=False)
+    timestamp_iso: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Precompute serialized values so API responses skip enum and datetime work."""
+        self.type_value = self.stimulus_type.value
+        self.intensity_value = self.intensity.value
+        self.timestamp_iso = self.timestamp.isoformat()
 
 
 class DataSource:
@@ -94,6 +94,13 @@ class World:
     max_factions: int = 20
     tick_limit: int = 10000
     
+    # Bumped by record_tick_history() once a tick's changes are complete, so
+    # caches and ETags can tell when world data has changed
+    revision: int = field(default=0, init=False, compare=False)
+    
+    # Dashboard counters cached per revision: ((revision, tick, state), stats)
+    _stats_cache: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    
     def __post_init__(self):
         """Initialize world after creation."""
         if self.seed is not None:
@@ -361,6 +368,7 @@ class World:
         }
         
         self.tick_history.append(tick_data)
+        self.revision += 1
         
         # Keep only recent history (last 1000 ticks)
         if len(self.tick_history) > 1000:
@@ -380,6 +388,21 @@ class World:
             "recent_history": self.tick_history[-10:] if self.tick_history else []
         }
     
+    def realtime_stats(self) -> Dict[str, Any]:
+        """Get headline counters for the live dashboard, rebuilt at most once per tick."""
+        key = (self.revision, self.current_tick, self.state)
+        if self._stats_cache is None or self._stats_cache[0] != key:
+            self._stats_cache = (key, {
+                "current_tick": self.current_tick,
+                "agent_count": len(self.agents),
+                "faction_count": len(self.factions),
+                "active_events": len(self.event_system.active_events),
+                "myth_count": len(self.culture.myths),
+                "norm_count": len(self.culture.active_norms),
+                "trade_count": len(self.economy.trade_history)
+            })
+        return self._stats_cache[1]
+    
     def get_agent_network_data(self) -> Dict[str, Any]:
         """Get agent network data for visualization."""
         nodes = []
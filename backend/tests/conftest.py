@@ -0,0 +1,34 @@
+"""
+Shared pytest fixtures for The Cognisphere test suite.
+"""
+
+import asyncio
+
+import pytest
+
+import auth
+
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """Share one event loop across all async tests in the session."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="class")
+def auth_env(request):
+    """
+    Apply authentication environment variables for a group of tests.
+    
+    Parametrize indirectly with a dict of variables to set. The environment is
+    applied once per parameter set and the auth configuration re-read so it
+    takes effect; everything is restored on teardown.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        for key, value in request.param.items():
+            mp.setenv(key, value)
+        auth._reload_config()
+        yield request.param
+    auth._reload_config()
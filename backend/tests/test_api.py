@@ -0,0 +1,205 @@
+"""
+Tests for the HTTP API layer.
+"""
+
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+import app as api
+from simulation.world import World
+
+
+@pytest.fixture
+def client():
+    """Create a test client with the app lifespan running."""
+    with TestClient(api.app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def world(client):
+    """Attach a bare world to the startup engine."""
+    api.simulation_engine.world = World()
+    return api.simulation_engine.world
+
+
+class TestTickETags:
+    """Test conditional GETs on polled data endpoints."""
+    
+    def test_not_modified_until_tick_recorded(self, client, world):
+        """Test that the ETag holds until a tick completes, then changes."""
+        response = client.get("/culture")
+        assert response.status_code == 200
+        etag = response.headers["ETag"]
+        
+        response = client.get("/culture", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        
+        # Advancing the tick counter alone doesn't change the data
+        world.current_tick += 1
+        response = client.get("/culture", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        
+        world.record_tick_history()
+        response = client.get("/culture", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+
+class TestRequestValidation:
+    """Test validation of request bodies on state-changing endpoints."""
+    
+    @pytest.mark.security
+    @pytest.mark.parametrize("name", ["a/b", "a\\b", "..", "../etc"])
+    def test_snapshot_name_rejects_path_components(self, client, name):
+        """Test that snapshot names containing separators or parent references are rejected."""
+        response = client.post("/snapshots", json={"name": name})
+        assert response.status_code == 422
+        assert "Invalid snapshot name" in response.json()["detail"]
+    
+    @pytest.mark.security
+    @pytest.mark.parametrize("field,value,message", [
+        ("snapshot_directory", "snapshots\\other", "Invalid snapshot directory path"),
+        ("snapshot_directory", "/tmp/snapshots", "Invalid snapshot directory path"),
+        ("stimuli_file", "data\\stimuli.json", "Invalid stimuli file path"),
+        ("stimuli_file", "../stimuli.json", "Invalid stimuli file path"),
+    ])
+    def test_initialize_rejects_unsafe_paths(self, client, field, value, message):
+        """Test that absolute, parent and backslash paths are rejected."""
+        response = client.post("/simulation/initialize", json={field: value})
+        assert response.status_code == 422
+        assert message in response.json()["detail"][0]["msg"]
+    
+    def test_control_rejects_unknown_action(self, client):
+        """Test that control actions outside the allowed set are rejected."""
+        response = client.post("/simulation/control", json={"action": "fly"})
+        assert response.status_code == 422
+    
+    @pytest.mark.parametrize("path,required", [
+        ("/simulation/control", True),
+        ("/snapshots", False),
+    ])
+    def test_msgspec_bodies_documented(self, client, path, required):
+        """Test that msgspec-decoded bodies still appear in the OpenAPI schema."""
+        request_body = client.get("/openapi.json").json()["paths"][path]["post"]["requestBody"]
+        assert request_body["required"] is required
+        assert request_body["content"]["application/json"]["schema"]["type"] == "object"
+
+
+class TestRealtimeWebSocket:
+    """Test the real-time WebSocket channel."""
+    
+    @pytest.fixture(autouse=True)
+    def fresh_broadcast(self, monkeypatch):
+        """Start each test without a cached real-time payload."""
+        monkeypatch.setattr(api, "last_realtime_key", None)
+        monkeypatch.setattr(api, "last_realtime_message", None)
+    
+    def test_binary_frames_ignored(self, client, world):
+        """Test that a binary frame from a subscriber doesn't end its connection."""
+        with client.websocket_connect("/ws/realtime") as websocket:
+            websocket.send_bytes(b"\x00")
+            websocket.receive_json()
+            
+            # The connection is still subscribed for the next tick's payload
+            world.record_tick_history()
+            assert "network" in websocket.receive_json()
+    
+    def test_stalled_subscriber_dropped(self, client, world, monkeypatch):
+        """Test that a subscriber that never accepts a message is dropped and closed."""
+        class StalledSocket:
+            close_code = None
+            
+            async def send_text(self, message):
+                await asyncio.Event().wait()
+            
+            async def close(self, code=1000):
+                self.close_code = code
+        
+        stalled = StalledSocket()
+        monkeypatch.setattr(api, "REALTIME_SEND_TIMEOUT", 0.05)
+        api.realtime_clients.add(stalled)
+        try:
+            with client.websocket_connect("/ws/realtime") as websocket:
+                websocket.receive_json()
+                world.record_tick_history()
+                websocket.receive_json()
+            assert stalled not in api.realtime_clients
+            assert stalled.close_code == 1011
+        finally:
+            api.realtime_clients.discard(stalled)
+    
+    def test_dropped_subscriber_receives_close(self, client, world, monkeypatch):
+        """Test that a subscriber whose send times out is told so with a 1011 close."""
+        monkeypatch.setattr(api, "REALTIME_SEND_TIMEOUT", 0)
+        
+        with client.websocket_connect("/ws/realtime") as websocket:
+            message = websocket.receive()
+        assert message["type"] == "websocket.close"
+        assert message["code"] == 1011
+    
+    def test_late_joiner_skips_payload_from_replaced_world(self, client, world, monkeypatch):
+        """Test that a payload cached for a previous world isn't replayed to new subscribers."""
+        monkeypatch.setattr(api, "last_realtime_key", (-1, 0, 0, api.simulation_engine.state))
+        monkeypatch.setattr(api, "last_realtime_message", '{"stale": true}')
+        
+        with client.websocket_connect("/ws/realtime") as websocket:
+            payload = websocket.receive_json()
+        assert "stale" not in payload
+        assert payload["tick"] == world.current_tick
+
+
+class TestSnapshotJobs:
+    """Test background snapshot jobs."""
+    
+    @pytest.fixture(autouse=True)
+    def isolated_jobs(self, monkeypatch):
+        """Give each test its own job table."""
+        monkeypatch.setattr(api, "snapshot_jobs", {})
+    
+    def test_job_lifecycle(self, client, world, tmp_path, monkeypatch):
+        """Test that a snapshot job is accepted, completes and reports its file."""
+        monkeypatch.setattr(api.simulation_engine.config, "snapshot_directory", str(tmp_path))
+        
+        response = client.post("/snapshots", json={"name": "lifecycle"})
+        assert response.status_code == 202
+        job_id = response.json()["job_id"]
+        
+        job = client.get(f"/snapshots/{job_id}/status").json()
+        assert job["status"] == "completed"
+        assert job["file"].startswith(str(tmp_path))
+        assert api.simulation_engine._read_snapshot_file(job["file"])["name"] == "lifecycle"
+    
+    def test_failed_job_reports_error(self, client, world, tmp_path, monkeypatch):
+        """Test that a snapshot that can't be written marks its job as failed."""
+        monkeypatch.setattr(api.simulation_engine.config, "snapshot_directory", str(tmp_path / "missing"))
+        
+        job_id = client.post("/snapshots", json={}).json()["job_id"]
+        
+        job = client.get(f"/snapshots/{job_id}/status").json()
+        assert job["status"] == "failed"
+        assert job["error"]
+    
+    def test_unknown_job(self, client):
+        """Test that an unknown job id returns 404."""
+        assert client.get("/snapshots/unknown/status").status_code == 404
+    
+    def test_eviction_keeps_pending_jobs(self, monkeypatch):
+        """Test that only finished jobs are evicted once the table is full."""
+        monkeypatch.setattr(api, "MAX_SNAPSHOT_JOBS", 2)
+        api.snapshot_jobs.update({
+            "pending-1": {"status": "pending"},
+            "done-1": {"status": "completed"},
+            "pending-2": {"status": "pending"},
+            "done-2": {"status": "failed"},
+        })
+        
+        api._evict_finished_snapshot_jobs()
+        assert list(api.snapshot_jobs) == ["pending-1", "pending-2"]
+    
+    async def test_evicted_job_is_skipped(self):
+        """Test that a job evicted before it runs doesn't fail the background task."""
+        await api._run_snapshot_job(api.simulation_engine, "evicted", None)
+        assert "evicted" not in api.snapshot_jobs
@@ -2,74 +2,65 @@
 Tests for authentication and authorization.
 """
 
-import os
+import hmac
+from unittest import mock
+
 import pytest
-from unittest.mock import patch, MagicMock
 from fastapi import HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials
 
 from auth import verify_api_key, get_auth_status
 
+pytestmark = [pytest.mark.no_app, pytest.mark.xdist_group("auth_unit")]
+
+
+AUTH_DISABLED = {"REQUIRE_AUTH": "false", "API_KEY": ""}
+AUTH_NO_KEY = {"REQUIRE_AUTH": "true", "API_KEY": ""}
+AUTH_ENABLED = {"REQUIRE_AUTH": "true", "API_KEY": "test-key"}
+
 
 class TestAuthentication:
     """Test authentication functionality."""
     
-    def test_auth_status_disabled(self):
-        """Test auth status when authentication is disabled."""
-        with patch.dict(os.environ, {"REQUIRE_AUTH": "false", "API_KEY": ""}):
-            status = get_auth_status()
-            assert status["authentication_required"] is False
-            assert status["status"] == "disabled"
-    
-    def test_auth_status_enabled(self):
-        """Test auth status when authentication is enabled."""
-        with patch.dict(os.environ, {"REQUIRE_AUTH": "true", "API_KEY": "test-key"}):
-            status = get_auth_status()
-            assert status["authentication_required"] is True
-            assert status["api_key_configured"] is True
-            assert status["status"] == "enabled"
+    @pytest.mark.parametrize("auth_env,expected", [
+        pytest.param(AUTH_DISABLED, {"authentication_required": False, "status": "disabled"}, id="disabled"),
+        pytest.param(AUTH_NO_KEY, {"authentication_required": True, "status": "disabled"}, id="no-key"),
+        pytest.param(AUTH_ENABLED, {"authentication_required": True, "api_key_configured": True, "status": "enabled"}, id="enabled"),
+    ], indirect=["auth_env"])
+    def test_auth_status(self, auth_env, expected):
+        """Test auth status reporting for each configuration."""
+        auth_status = get_auth_status()
+        for key, value in expected.items():
+            assert auth_status[key] == value
     
-    @pytest.mark.asyncio
-    async def test_verify_api_key_no_auth_required(self):
-        """Test API key verification when auth is not required."""
-        with patch.dict(os.environ, {"REQUIRE_AUTH": "false"}):
-            result = await verify_api_key(None)
-            assert result is True
+    @pytest.mark.parametrize("auth_env,credential,detail", [
+        pytest.param({"REQUIRE_AUTH": "false"}, None, None, id="no-auth-required"),
+        pytest.param(AUTH_NO_KEY, None, None, id="no-key-configured"),
+        pytest.param(AUTH_ENABLED, None, "Missing authentication credentials", id="missing-credentials"),
+        pytest.param(AUTH_ENABLED, "wrong-key", "Invalid API key", id="invalid-key"),
+        pytest.param(AUTH_ENABLED, "test-key", None, id="valid-key"),
+    ], indirect=["auth_env"])
+    async def test_verify_api_key(self, auth_env, credential, detail):
+        """Test API key verification; detail is the expected 401 message, if any."""
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=credential) if credential is not None else None
+        
+        if detail is None:
+            assert await verify_api_key(credentials) is True
+            return
+        
+        with pytest.raises(HTTPException) as exc_info:
+            await verify_api_key(credentials)
+        assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
+        assert detail in exc_info.value.detail
     
-    @pytest.mark.asyncio
-    async def test_verify_api_key_no_key_configured(self):
-        """Test API key verification when no key is configured."""
-        with patch.dict(os.environ, {"REQUIRE_AUTH": "true", "API_KEY": ""}):
-            result = await verify_api_key(None)
-            assert result is True
-    
-    @pytest.mark.asyncio
-    async def test_verify_api_key_missing_credentials(self):
-        """Test API key verification with missing credentials."""
-        with patch.dict(os.environ, {"REQUIRE_AUTH": "true", "API_KEY": "test-key"}):
-            with pytest.raises(HTTPException) as exc_info:
-                await verify_api_key(None)
-            assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
-            assert "Missing authentication credentials" in exc_info.value.detail
-    
-    @pytest.mark.asyncio
-    async def test_verify_api_key_invalid_key(self):
-        """Test API key verification with invalid key."""
-        with patch.dict(os.environ, {"REQUIRE_AUTH": "true", "API_KEY": "test-key"}):
-            credentials = MagicMock()
-            credentials.credentials = "wrong-key"
-            
-            with pytest.raises(HTTPException) as exc_info:
+    @pytest.mark.security
+    @pytest.mark.parametrize("auth_env", [AUTH_ENABLED], indirect=True)
+    async def test_verify_api_key_constant_time(self, auth_env):
+        """Test that keys are compared with hmac.compare_digest rather than ==."""
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials="wrong-key")
+        
+        with mock.patch("auth.hmac.compare_digest", wraps=hmac.compare_digest) as compare_digest:
+            with pytest.raises(HTTPException):
                 await verify_api_key(credentials)
-            assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
-            assert "Invalid API key" in exc_info.value.detail
-    
-    @pytest.mark.asyncio
-    async def test_verify_api_key_valid_key(self):
-        """Test API key verification with valid key."""
-        with patch.dict(os.environ, {"REQUIRE_AUTH": "true", "API_KEY": "test-key"}):
-            credentials = MagicMock()
-            credentials.credentials = "test-key"
-            
-            result = await verify_api_key(credentials)
-            assert result is True
-
+        
+        compare_digest.assert_called_once_with(b"wrong-key", b"test-key")
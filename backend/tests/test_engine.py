@@ -5,8 +5,8 @@ Tests for the simulation engine core functionality.
 import pytest
 import asyncio
 
-from simulation.engine import SimulationEngine, SimulationConfig
-from simulation.world import WorldState
+from simulation.engine import SimulationEngine, SimulationConfig, ZSTD_AVAILABLE
+from simulation.world import World, WorldState
 from simulation.agents import Agent
 from adapters import LLMMode
 
@@ -171,6 +171,21 @@ class TestSimulationEngine:
         assert "num_agents" in config_dict
         assert "seed" in config_dict
     
+    def test_world_summary_cache_invalidation(self, engine):
+        """Test that the cached world summary follows tick completion and world swaps."""
+        engine.world = World()
+        engine.world_generation = 1
+        assert engine.get_world_summary()["recent_history"] == []
+        
+        engine.world.record_tick_history()
+        assert len(engine.get_world_summary()["recent_history"]) == 1
+        
+        # A replacement world at the same revision must not reuse the old summary
+        engine.world = World(seed=7)
+        engine.world.record_tick_history()
+        engine.world_generation = 2
+        assert engine.get_world_summary()["seed"] == 7
+    
     @pytest.mark.asyncio
     async def test_cleanup(self, engine):
         """Test engine cleanup."""
@@ -232,6 +247,55 @@ class TestSimulationConfig:
         assert config_dict["llm_mode"] == "mock"
 
 
+class TestWorldRevision:
+    """Test the world revision counter used to key caches and ETags."""
+    
+    def test_revision_bumped_when_tick_recorded(self):
+        """Test that recording a tick bumps the revision but advancing the counter doesn't."""
+        world = World()
+        assert world.revision == 0
+        
+        world.record_tick_history()
+        assert world.revision == 1
+        
+        world.current_tick += 1
+        assert world.revision == 1
+    
+    def test_realtime_stats_refreshed_after_tick(self):
+        """Test that cached dashboard counters pick up changes once a tick is recorded."""
+        world = World()
+        assert world.realtime_stats()["trade_count"] == 0
+        
+        world.economy.trade_history.append({"tick": 0})
+        world.record_tick_history()
+        assert world.realtime_stats()["trade_count"] == 1
+
+
+class TestSnapshotFiles:
+    """Test reading and writing snapshot files."""
+    
+    @pytest.mark.parametrize("extension", [
+        ".json",
+        pytest.param(".json.zst", marks=pytest.mark.skipif(not ZSTD_AVAILABLE, reason="zstandard not installed")),
+    ])
+    def test_snapshot_file_round_trip(self, tmp_path, extension):
+        """Test that a snapshot written to disk reads back unchanged."""
+        snapshot = {"name": "round_trip", "tick": 12, "world_summary": {"statistics": {"gini_coefficient": 0.25}}}
+        snapshot_file = str(tmp_path / f"round_trip{extension}")
+        
+        SimulationEngine._write_snapshot_file(snapshot_file, snapshot)
+        assert SimulationEngine._read_snapshot_file(snapshot_file) == snapshot
+    
+    @pytest.mark.skipif(not ZSTD_AVAILABLE, reason="zstandard not installed")
+    def test_compressed_snapshot_is_zstd_frame(self, tmp_path):
+        """Test that .zst snapshots are actually compressed."""
+        snapshot_file = str(tmp_path / "compressed.json.zst")
+        SimulationEngine._write_snapshot_file(snapshot_file, {"tick": 1})
+        
+        with open(snapshot_file, "rb") as f:
+            assert f.read(4) == b"\x28\xb5\x2f\xfd"
+
+
 @pytest.mark.asyncio
 async def test_benchmark_simulation():
     """Test running a benchmark simulation."""